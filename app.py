@@ -9,7 +9,12 @@ from pathlib import Path
 from dotenv import load_dotenv
 import numpy as np
 import soundfile as sf
+import shutil
 import time
+import atexit
+import logging
+import logging.handlers
+import queue
 
 # Import core modules
 from core.audio_recorder import AudioRecorder
@@ -17,6 +22,7 @@ from core.voice_cloner import VoiceCloner
 from core.speech_to_text import SpeechToText
 from core.translator import Translator
 from core.text_to_speech import TextToSpeech
+from core.pipeline import ChunkTranslator, run_speech_translation
 from utils.config import Config
 from utils.audio_utils import AudioUtils
 
@@ -32,78 +38,44 @@ st.set_page_config(
 )
 
 # --- CUSTOM CSS ---
-st.markdown("""
-    <style>
-    /* Main Theme */
-    .main {
-        background-color: #0E1117;
-    }
-    
-    /* Header */
-    .main-header {
-        text-align: center;
-        padding: 2rem 1rem;
-        background: linear-gradient(135deg, #00B4DB 0%, #0083B0 100%);
-        color: white;
-        border-radius: 12px;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 15px rgba(0, 150, 200, 0.2);
-    }
-    .main-header h1 {
-        font-size: 3rem;
-        font-weight: 700;
-    }
-    .main-header p {
-        font-size: 1.1rem;
-        color: #E0E0E0;
-    }
-    
-    /* Tool Cards */
-    .tool-card {
-        background-color: #1E1E1E;
-        padding: 1.5rem 2rem;
-        border-radius: 12px;
-        margin-bottom: 1.5rem;
-        border: 1px solid #2A2A2A;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
-        height: 100%;
-    }
-    .tool-card h3 {
-        color: #00B4DB;
-        margin-bottom: 1rem;
-    }
-    
-    /* Buttons */
-    .stButton>button {
-        width: 100%;
-        background-color: #0083B0;
-        color: white;
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        font-weight: bold;
-        border: none;
-        transition: background-color 0.3s ease;
-    }
-    .stButton>button:hover {
-        background-color: #00B4DB;
-        color: white;
-    }
-    .stButton>button[kind="secondary"] {
-        background-color: #444;
-    }
-    .stButton>button[kind="secondary"]:hover {
-        background-color: #666;
-    }
+STYLE_PATH = Path(__file__).parent / "assets" / "style.css"
 
-    /* Results section */
-    .results-container {
-        background-color: #1E1E1E;
-        padding: 2rem;
-        border-radius: 12px;
-        border: 1px solid #2A2A2A;
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def load_css():
+    """Read the app stylesheet once; reruns reuse the cached string."""
+    return f"<style>\n{STYLE_PATH.read_text(encoding='utf-8')}</style>"
+
+HEADER_HTML = """
+    <div class="main-header">
+        <h1>🗣️ VocalizeAI</h1>
+        <p>Konuş, Çevir, Seslendir - Your Voice, Any Language</p>
+    </div>
+"""
+
+st.markdown(load_css(), unsafe_allow_html=True)
+
+
+# --- LOGGING ---
+@st.cache_resource
+def setup_logging():
+    """
+    Send core module logs to the console through a queue.
+
+    Records are queued by the calling thread and written by a single
+    listener thread, so batch workers never block on console I/O. Cached
+    so reruns don't attach a second handler.
+    """
+    log_queue = queue.SimpleQueue()
+    core_logger = logging.getLogger("core")
+    core_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    core_logger.setLevel(logging.INFO)
+    core_logger.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+setup_logging()
 
 
 def initialize_session_state():
@@ -121,18 +93,69 @@ def initialize_session_state():
             st.session_state[key] = value
 
 
+# --- MOCK AUDIO ---
+# Two seconds of silence, written once and copied for every mock synthesis
+SILENT_WAV_PATH = Path(__file__).parent / "assets" / "_silent_2s.wav"
+
+def get_silent_wav():
+    """Return the path of the silent mock WAV, creating it on first use."""
+    if not SILENT_WAV_PATH.exists():
+        sf.write(str(SILENT_WAV_PATH), np.zeros(22050 * 2, dtype=np.int16), 22050)
+    return SILENT_WAV_PATH
+
+
+# --- CACHED CORE COMPONENTS ---
+# Streamlit re-runs this script on every interaction; cache_resource keeps a
+# single instance of each component (HTTP sessions, SDK clients) across reruns.
+@st.cache_resource
+def get_config():
+    return Config()
+
+def get_audio_recorder(config):
+    # AudioRecorder keeps per-recording state (frames, queue, is_recording), so
+    # it is kept per browser session rather than shared through cache_resource
+    if 'audio_recorder' not in st.session_state:
+        st.session_state.audio_recorder = AudioRecorder(config)
+    return st.session_state.audio_recorder
+
+@st.cache_resource
+def get_translator():
+    return Translator()
+
+@st.cache_resource
+def get_voice_cloner(api_key):
+    return VoiceCloner(api_key)
+
+@st.cache_resource
+def get_speech_to_text(api_key):
+    return SpeechToText(api_key)
+
+@st.cache_resource
+def get_text_to_speech(api_key):
+    return TextToSpeech(api_key)
+
+
+# --- SPEECH-TO-SPEECH PIPELINE ---
+def merge_audio_chunks(audio_paths, output_dir):
+    """Join per-chunk audio files into one file; returns its path."""
+    if len(audio_paths) == 1:
+        return audio_paths[0]
+    suffix = Path(audio_paths[0]).suffix
+    output_path = Path(output_dir) / f"vocalizeai_translation_{int(time.time())}{suffix}"
+    if suffix == ".mp3":
+        merged = AudioUtils.concatenate_mp3_files(audio_paths, str(output_path))
+    else:
+        merged = AudioUtils.merge_audio_files(audio_paths, str(output_path))
+    return str(output_path) if merged else audio_paths[0]
+
+
 def main():
     """Main application function."""
     
     initialize_session_state()
     
     # --- HEADER ---
-    st.markdown("""
-        <div class="main-header">
-            <h1>🗣️ VocalizeAI</h1>
-            <p>Konuş, Çevir, Seslendir - Your Voice, Any Language</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # --- API KEY CHECK ---
     api_key = os.getenv("ELEVENLABS_API_KEY")
@@ -143,14 +166,14 @@ def main():
     
     # --- INITIALIZE CORE COMPONENTS (with mock fallbacks if API key missing) ---
     try:
-        config = Config()
-        audio_recorder = AudioRecorder(config)
-        translator = Translator()
+        config = get_config()
+        audio_recorder = get_audio_recorder(config)
+        translator = get_translator()
 
         if not use_mock:
-            voice_cloner = VoiceCloner(api_key)
-            speech_to_text = SpeechToText(api_key)
-            text_to_speech = TextToSpeech(api_key)
+            voice_cloner = get_voice_cloner(api_key)
+            speech_to_text = get_speech_to_text(api_key)
+            text_to_speech = get_text_to_speech(api_key)
         else:
             class MockVoiceCloner:
                 def clone_voice(self, audio_path, voice_name): time.sleep(2); return f"mock_{int(time.time())}_{voice_name}"
@@ -162,7 +185,7 @@ def main():
                     out_dir = Path(config.OUTPUT_DIR) if hasattr(config, 'OUTPUT_DIR') else Path('assets/outputs')
                     out_dir.mkdir(parents=True, exist_ok=True)
                     out_path = out_dir / f"vocalizeai_mock_{int(time.time())}.wav"
-                    sf.write(str(out_path), np.zeros(22050 * 2), 22050); return str(out_path)
+                    shutil.copyfile(get_silent_wav(), out_path); return str(out_path)
             voice_cloner = MockVoiceCloner(); speech_to_text = MockSpeechToText(); text_to_speech = MockTextToSpeech()
     except Exception as e:
         st.error(f"Uygulama bileşenleri başlatılırken bir hata oluştu: {e}"); return
@@ -223,26 +246,50 @@ def main():
             if audio_path_translate:
                 st.audio(audio_path_translate)
                 progress_bar = st.progress(0, "Başlatılıyor...")
+                transcript_box = st.empty(); translation_box = st.empty()
                 try:
                     voice_to_use = get_voice_id_and_show_info()
-                    
-                    progress_bar.progress(25, "1/3: Ses metne dönüştürülüyor...")
-                    transcribed_text = speech_to_text.transcribe(audio_path_translate)
+                    stage_labels = ("1/3: Ses metne dönüştürülüyor", "2/3: Metin çevriliyor", "3/3: Konuşma oluşturuluyor")
+                    completed_steps = [0]
+
+                    def show_progress(stage_index, chunk_index, results):
+                        # Partial results are rendered as soon as each chunk finishes a stage
+                        chunk_count = len(results[0])
+                        completed_steps[0] += 1
+                        progress_bar.progress(int(completed_steps[0] * 100 / (3 * chunk_count)),
+                                              f"{stage_labels[stage_index]}... ({chunk_index + 1}/{chunk_count})")
+                        partial_text = " ".join(t for t in results[stage_index] if t)
+                        if stage_index == 0: transcript_box.info(f"**Deşifre Edilen Metin:**\n\n{partial_text}")
+                        elif stage_index == 1: translation_box.success(f"**Çevrilmiş Metin ({target_language}):**\n\n{partial_text}")
+
+                    (transcripts, translations, audio_paths), failures = run_speech_translation(
+                        audio_path_translate, config.TEMP_DIR,
+                        (speech_to_text.transcribe,
+                         ChunkTranslator(translator, target_language),
+                         lambda text: text_to_speech.synthesize(text, voice_to_use, stability, similarity)),
+                        on_update=show_progress
+                    )
+
+                    transcribed_text = " ".join(t for t in transcripts if t)
                     st.session_state.source_text = transcribed_text
                     st.session_state.source_text_label = "Deşifre Edilen Metin"
                     if not transcribed_text: raise ValueError("Ses metne dönüştürülemedi.")
 
-                    progress_bar.progress(50, "2/3: Metin çevriliyor...")
-                    translated_text = translator.translate(transcribed_text, target_language)
+                    translated_text = " ".join(t for t in translations if t)
                     st.session_state.translated_text = translated_text
                     if not translated_text: raise ValueError("Metin çevrilemedi.")
-                    
-                    progress_bar.progress(75, "3/3: Konuşma oluşturuluyor...")
-                    output_path = text_to_speech.synthesize(translated_text, voice_to_use, stability, similarity)
-                    st.session_state.output_audio_path = output_path
+
+                    audio_paths = [p for p in audio_paths if p]
+                    st.session_state.output_audio_path = merge_audio_chunks(audio_paths, config.OUTPUT_DIR) if audio_paths else None
+                    if not audio_paths: raise ValueError("Konuşma oluşturulamadı.")
+
+                    if failures:
+                        failed_steps = ("ses metne dönüştürülemedi", "metin çevrilemedi", "konuşma oluşturulamadı")
+                        details = "; ".join(f"{chunk + 1}. parça: {failed_steps[stage]}" for stage, chunk in failures)
+                        st.warning(f"⚠️ Bazı parçalar işlenemedi, sonuç eksik olabilir ({details}).")
                     progress_bar.progress(100, "Tamamlandı!")
                 except Exception as e: st.error(f"Bir hata oluştu: {e}")
-                finally: progress_bar.empty()
+                finally: progress_bar.empty(); transcript_box.empty(); translation_box.empty()
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -0,0 +1,141 @@
+"""
+Speech-to-Speech Pipeline Module
+Runs transcribe, translate and synthesize stages over audio chunks concurrently
+"""
+
+from pathlib import Path
+import asyncio
+import logging
+
+from utils.audio_utils import AudioUtils
+
+
+# Handlers are left to the application (see app.py)
+logger = logging.getLogger(__name__)
+
+
+# Recordings are processed in chunks of this many seconds so that the
+# transcribe, translate and synthesize stages can overlap
+PIPELINE_CHUNK_SECONDS = 5
+
+# langdetect is unreliable on the few words of a single chunk; the source
+# language is only fixed once this much transcript has accumulated
+SOURCE_LANG_MIN_CHARS = 100
+
+
+async def _pipeline_stage(func, in_queue, out_queue, on_done):
+    """
+    Apply func to each (index, value) item in a worker thread and pass the result on
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await in_queue.get()
+        if item is None:
+            await out_queue.put(None)
+            return
+        index, value = item
+        result, failed = None, False
+        if value:  # empty input (e.g. a silent chunk) is skipped, not a failure
+            try:
+                result = await loop.run_in_executor(None, func, value)
+            except Exception as e:
+                logger.error("❌ Pipeline stage failed on chunk %d: %s", index + 1, e)
+            failed = result is None
+        on_done(index, result, failed)
+        await out_queue.put((index, result))
+
+
+def run_speech_translation(audio_path, chunk_dir, stages, on_update=None):
+    """
+    Run audio through a chain of stages chunk by chunk, with stages overlapping.
+
+    While chunk N is synthesized, chunk N+1 is translated and chunk N+2
+    transcribed, so total time approaches the slowest stage instead of the sum.
+
+    Args:
+        audio_path: Recorded audio file
+        chunk_dir: Directory for temporary chunk files
+        stages: Blocking callables (transcribe, translate, synthesize); each
+            takes the previous stage's output for one chunk
+        on_update: Optional callback(stage_index, chunk_index, results), called
+            on the calling thread whenever a chunk finishes a stage
+
+    Returns:
+        tuple: (results, failures) - one list of per-chunk results for each
+            stage in chunk order, and the sorted (stage_index, chunk_index)
+            pairs whose stage call returned None or raised
+    """
+    chunk_paths = AudioUtils.split_audio(audio_path, chunk_dir, PIPELINE_CHUNK_SECONDS) or [audio_path]
+    results = [[None] * len(chunk_paths) for _ in stages]
+    failures = []
+
+    def recorder(stage_index):
+        def on_done(chunk_index, result, failed):
+            results[stage_index][chunk_index] = result
+            if failed:
+                failures.append((stage_index, chunk_index))
+            if on_update:
+                on_update(stage_index, chunk_index, results)
+        return on_done
+
+    async def pipeline():
+        queues = [asyncio.Queue() for _ in range(len(stages) + 1)]
+        for item in enumerate(chunk_paths):
+            queues[0].put_nowait(item)
+        queues[0].put_nowait(None)
+        await asyncio.gather(*(
+            _pipeline_stage(func, queues[i], queues[i + 1], recorder(i))
+            for i, func in enumerate(stages)
+        ))
+
+    try:
+        asyncio.run(pipeline())
+    finally:
+        for chunk_path in chunk_paths:
+            if chunk_path != audio_path:
+                Path(chunk_path).unlink(missing_ok=True)
+
+    return results, sorted(failures, key=lambda f: (f[1], f[0]))
+
+
+class ChunkTranslator:
+    """
+    Pipeline translate stage that pins the source language once it is reliable
+
+    Chunks are auto-detected individually until SOURCE_LANG_MIN_CHARS of
+    transcript have accumulated; the language detected on that text is then
+    used for every later chunk.
+    """
+
+    def __init__(self, translator, target_lang, min_chars=SOURCE_LANG_MIN_CHARS):
+        """
+        Initialize the translate stage
+
+        Args:
+            translator: Translator instance
+            target_lang: Target language code
+            min_chars: Transcript length needed before detecting the source language
+        """
+        self.translator = translator
+        self.target_lang = target_lang
+        self.min_chars = min_chars
+        self.source_lang = None
+        self._transcript = []
+        self._transcript_chars = 0
+
+    def __call__(self, text):
+        """
+        Translate one chunk of transcript
+
+        Chunks arrive in order from a single pipeline worker, so no locking is needed.
+        """
+        if self.source_lang is None:
+            self._transcript.append(text)
+            self._transcript_chars += len(text)
+            if self._transcript_chars >= self.min_chars:
+                self.source_lang = self.translator.detect_language(" ".join(self._transcript))
+                if self.source_lang:
+                    logger.info("🔍 Source language: %s", self.source_lang)
+                    self._transcript = []
+
+        return self.translator.translate(text, self.target_lang, source_lang=self.source_lang or 'auto')
@@ -3,33 +3,386 @@ Text to Speech Module
 Handles speech synthesis using ElevenLabs API with cloned voices
 """
 
-from elevenlabs import ElevenLabs, Voice, VoiceSettings
 from pathlib import Path
 from datetime import datetime
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import hashlib
+import os
+import shutil
 import json
+import functools
+import re
+import logging
+import asyncio
+from typing import NamedTuple
+
+
+# Handlers are left to the application (see app.py)
+logger = logging.getLogger(__name__)
+
+
+# ElevenLabs text-to-speech REST endpoint
+_TTS_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+# Cheap authenticated endpoint used to pre-open a connection
+_VOICES_URL = "https://api.elevenlabs.io/v1/voices"
+
+# Retry policy shared by the sync session and the async batch path
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy_import_elevenlabs():
+    """
+    Import the ElevenLabs SDK on first use
+    
+    The SDK is slow to import and only needed when use_sdk is enabled.
+    
+    Returns:
+        tuple: (ElevenLabs, VoiceSettings), or None if not installed
+    """
+    try:
+        from elevenlabs import ElevenLabs, VoiceSettings
+    except ImportError:
+        return None
+    return ElevenLabs, VoiceSettings
+
+
+def _create_session(headers):
+    """
+    Create a keep-alive HTTP session for the ElevenLabs REST API
+    
+    requests is imported here so that importing this module stays cheap.
+    
+    Args:
+        headers: Headers sent with every request
+    
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTPS adapter
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=_MAX_RETRIES,
+            backoff_factor=_RETRY_BACKOFF,
+            # Never retry a read error or timeout: the server may still be
+            # generating (and billing) the first attempt
+            read=0,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=None  # TTS requests are POSTs
+        )
+    ))
+    session.headers.update(headers)
+    return session
+
+
+# Matches one word (a run of non-whitespace characters)
+_WORD_PATTERN = re.compile(r'\S+')
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_text(text, max_length):
+    """
+    Cached implementation of TextToSpeech.validate_text
+    """
+    # isspace() stops at the first non-whitespace character and, unlike
+    # strip(), does not build a copy of the text
+    if not text or text.isspace():
+        return False, "Text is empty"
+    
+    if len(text) > max_length:
+        return False, f"Text too long ({len(text)} chars). Maximum: {max_length}"
+    
+    return True, "Text valid"
+
+
+@functools.lru_cache(maxsize=32)
+def _payload_suffix(model, stability, similarity):
+    """
+    Serialized JSON tail of a TTS request body (everything after the text)
+    """
+    voice_settings = json.dumps({"stability": stability, "similarity_boost": similarity})
+    return f',"model_id":{json.dumps(model)},"voice_settings":{voice_settings}}}'.encode("utf-8")
+
+
+def _build_payload(text, model, stability, similarity):
+    """
+    Build the JSON body for a TTS request
+    
+    Only the text is serialized per call; the model and voice settings part
+    is cached, since it is the same for every item of a batch.
+    
+    Returns:
+        bytes: UTF-8 encoded JSON request body
+    """
+    return b'{"text":' + json.dumps(text).encode("utf-8") + _payload_suffix(model, stability, similarity)
+
+
+# Streamed audio is flushed to disk in batches of this many bytes
+_WRITE_BATCH_SIZE = 64 * 1024
+# Stay well under the platform's IOV_MAX when many tiny chunks arrive
+_WRITE_BATCH_MAX_BUFFERS = 256
+
+
+def _write_buffers(fd, buffers):
+    """
+    Write a list of buffers to a file descriptor with as few syscalls as possible
+    """
+    if hasattr(os, 'writev'):
+        written = os.writev(fd, buffers)
+        if written == sum(len(b) for b in buffers):
+            return
+        remaining = memoryview(b"".join(buffers))[written:]
+    else:
+        # Windows has no writev
+        remaining = memoryview(b"".join(buffers))
+
+    while remaining:
+        written = os.write(fd, remaining)
+        remaining = remaining[written:]
+
+
+def _write_chunks(path, chunks):
+    """
+    Write an iterable of byte chunks to a file, batching them into vectored writes
+    
+    Args:
+        path: Output file path
+        chunks: Iterable of bytes-like chunks
+    
+    Returns:
+        int: Number of bytes written
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        bytes_written = 0
+        pending = []
+        pending_size = 0
+        for chunk in chunks:
+            if not chunk:
+                continue
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= _WRITE_BATCH_SIZE or len(pending) >= _WRITE_BATCH_MAX_BUFFERS:
+                _write_buffers(fd, pending)
+                bytes_written += pending_size
+                pending = []
+                pending_size = 0
+
+        if pending:
+            _write_buffers(fd, pending)
+            bytes_written += pending_size
+
+        return bytes_written
+    finally:
+        os.close(fd)
+
+
+# MPEG audio frame header lookup tables, indexed by the header's version bits
+# (0 = MPEG 2.5, 2 = MPEG 2, 3 = MPEG 1) and layer bits (1 = III, 2 = II, 3 = I)
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000)
+}
+_MP3_BITRATES = {
+    (3, 3): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (3, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (3, 1): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 3): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 1): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+}
+
+
+def _read_mp3_info(audio_path):
+    """
+    Read MP3 stream information from the first frame header
+    
+    Parses the ID3v2 tag size, the first MPEG frame header and, when present,
+    the Xing/Info or VBRI header, without decoding any audio.
+    
+    Args:
+        audio_path: Path to MP3 file
+    
+    Returns:
+        dict: Audio information, or None if no valid frame header was found
+    """
+    file_size = os.path.getsize(audio_path)
+
+    with open(audio_path, 'rb') as f:
+        head = f.read(10)
+        offset = 0
+        if head[:3] == b'ID3' and len(head) == 10:
+            # Synchsafe integer: 7 significant bits per byte
+            tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            offset = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+        f.seek(offset)
+        buf = f.read(4096)
+
+        # A trailing ID3v1 tag is 128 bytes of metadata, not audio
+        trailer = 0
+        if file_size - offset >= 128:
+            f.seek(-128, os.SEEK_END)
+            if f.read(3) == b'TAG':
+                trailer = 128
+
+    # Locate the first frame sync (11 set bits)
+    pos = buf.find(b'\xff')
+    while pos != -1 and pos + 4 <= len(buf):
+        if buf[pos + 1] & 0xE0 == 0xE0:
+            break
+        pos = buf.find(b'\xff', pos + 1)
+    else:
+        return None
+
+    header = int.from_bytes(buf[pos:pos + 4], 'big')
+    version = (header >> 19) & 0x3
+    layer = (header >> 17) & 0x3
+    bitrate_idx = (header >> 12) & 0xF
+    sr_idx = (header >> 10) & 0x3
+    channel_mode = (header >> 6) & 0x3
+    # Protection bit 0 means a 16-bit CRC follows the header
+    crc_size = 0 if (header >> 16) & 0x1 else 2
+
+    if version == 1 or layer == 0 or bitrate_idx in (0, 15) or sr_idx == 3:
+        return None
+
+    sample_rate = _MP3_SAMPLE_RATES[version][sr_idx]
+    bitrate = _MP3_BITRATES[(3 if version == 3 else 2, layer)][bitrate_idx] * 1000
+    channels = 1 if channel_mode == 3 else 2
+
+    if layer == 3:
+        samples_per_frame = 384
+    elif layer == 1 and version != 3:
+        samples_per_frame = 576
+    else:
+        samples_per_frame = 1152
+
+    # VBR files carry the total frame count in a Xing/Info or VBRI header
+    frame_count = None
+    if layer == 1:
+        if version == 3:
+            side_info = 17 if channels == 1 else 32
+        else:
+            side_info = 9 if channels == 1 else 17
+        xing = pos + 4 + crc_size + side_info
+        if buf[xing:xing + 4] in (b'Xing', b'Info'):
+            flags = int.from_bytes(buf[xing + 4:xing + 8], 'big')
+            if flags & 0x1:
+                frame_count = int.from_bytes(buf[xing + 8:xing + 12], 'big')
+        elif buf[pos + 36:pos + 40] == b'VBRI':
+            frame_count = int.from_bytes(buf[pos + 50:pos + 54], 'big')
+
+    if frame_count:
+        frames = frame_count * samples_per_frame
+        duration = frames / sample_rate
+    else:
+        # Constant bitrate: duration follows from the audio payload size
+        duration = (file_size - offset - pos - trailer) * 8 / bitrate
+        frames = int(duration * sample_rate)
+
+    return {
+        'duration': duration,
+        'sample_rate': sample_rate,
+        'channels': channels,
+        'format': 'MP3',
+        'frames': frames,
+        'file_size': file_size
+    }
+
+
+class VoicePreset(NamedTuple):
+    """
+    Named voice settings preset
+    """
+    stability: float
+    similarity: float
+
+
+_VOICE_PRESETS = {
+    'stable': VoicePreset(stability=0.75, similarity=0.75),
+    'balanced': VoicePreset(stability=0.50, similarity=0.75),
+    'expressive': VoicePreset(stability=0.30, similarity=0.80)
+}
 
 
 class TextToSpeech:
     """
     Text-to-speech synthesis using ElevenLabs API
     """
+
+    # Upper bound on simultaneous ElevenLabs requests (API concurrency limit)
+    MAX_CONCURRENT_REQUESTS = 4
+
+    # Size cap for the synthesized-audio cache before old entries are evicted
+    CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+    # Timeout in seconds for TTS requests (sync: per connect/read, async: total).
+    # Keeps a stalled connection from holding a request slot indefinitely
+    REQUEST_TIMEOUT = 120
     
-    def __init__(self, api_key):
+    def __init__(self, api_key, use_sdk=False, warmup=True):
         """
         Initialize TextToSpeech
         
         Args:
             api_key: ElevenLabs API key
+            use_sdk: Prefer the ElevenLabs SDK over direct REST calls (default: False)
+            warmup: Open a pooled API connection in the background (default: True)
         """
         self.api_key = api_key
-        self.client = ElevenLabs(api_key=api_key)
+        sdk = _lazy_import_elevenlabs() if use_sdk else None
+        self._use_sdk = sdk is not None
+        self.client = sdk[0](api_key=api_key) if self._use_sdk else None
+
+        # Resolve SDK capabilities once; their shape varies across SDK versions
+        tts_api = getattr(self.client, 'text_to_speech', None)
+        self._sdk_stream = getattr(tts_api, 'stream', None)
+
+        # Keep-alive session so REST calls reuse pooled TCP/TLS connections
+        self._headers = {
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "xi-api-key": api_key
+        }
+        self._session = _create_session(self._headers)
+        if warmup:
+            threading.Thread(target=self._warmup, name="tts-warmup", daemon=True).start()
+        self._request_slots = threading.Semaphore(self.MAX_CONCURRENT_REQUESTS)
         
         # Ensure output directory exists
         self.output_dir = Path("assets/outputs")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Content-addressed cache of previously synthesized audio
+        self.cache_dir = Path("assets/cache")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
     
-    def synthesize(self, text, voice_id, stability=0.5, similarity=0.75, output_path=None):
+    def _warmup(self):
+        """
+        Resolve DNS and complete the TLS handshake ahead of the first request.
+        
+        The connection is returned to the session's pool, so the first
+        synthesis call reuses it instead of paying the setup latency.
+        """
+        try:
+            with self._session.head(_VOICES_URL, timeout=5):
+                pass
+        except Exception as e:
+            logger.debug("Connection warm-up failed: %s", e)
+    
+    def synthesize(self, text, voice_id, stability=0.5, similarity=0.75, output_path=None, use_cache=True,
+                   model="eleven_monolingual_v1"):
         """
         Synthesize speech from text using a specific voice
         
@@ -39,67 +392,171 @@ class TextToSpeech:
             stability: Voice stability (0.0 to 1.0, default: 0.5)
             similarity: Voice similarity boost (0.0 to 1.0, default: 0.75)
             output_path: Custom output path (optional)
+            use_cache: Reuse previously synthesized audio for identical requests
+            model: TTS model ID (default: eleven_monolingual_v1)
         
         Returns:
             str: Path to generated audio file, or None if failed
         """
         try:
-            print(f"🎵 Synthesizing speech...")
-            print(f"📝 Text: {text}")
-            print(f"🆔 Voice ID: {voice_id}")
-
-            # First try SDK's text_to_speech.convert if available
-            if hasattr(self.client, 'text_to_speech') and hasattr(self.client.text_to_speech, 'convert'):
-                try:
-                    # The SDK may accept either text and voice_id or a more structured payload
-                    # SDK expects: convert(voice_id, *, text=..., model_id=..., voice_settings=...)
-                    resp = self.client.text_to_speech.convert(
-                        voice_id,
-                        text=text,
-                        model_id="eleven_monolingual_v1",
-                        voice_settings=VoiceSettings(stability=stability, similarity_boost=similarity)
-                    )
-
-                    # If SDK returns a raw response wrapper, try to extract bytes
-                    if hasattr(resp, 'content'):
-                        audio_bytes = resp.content
-                    elif isinstance(resp, (bytes, bytearray)):
-                        audio_bytes = bytes(resp)
-                    else:
-                        # Some SDKs yield generator of chunks
-                        try:
-                            audio_bytes = b"".join(resp)
-                        except Exception:
-                            audio_bytes = None
-
-                except Exception:
-                    audio_bytes = self._rest_generate_bytes(text, voice_id, stability, similarity, model="eleven_monolingual_v1")
-            else:
-                # Fallback to REST API
-                audio_bytes = self._rest_generate_bytes(text, voice_id, stability, similarity, model="eleven_monolingual_v1")
-
-            if audio_bytes is None:
-                print("❌ Speech synthesis failed: no audio received")
-                return None
+            logger.info("🎵 Synthesizing speech...")
+            logger.info("📝 Text: %s", text)
+            logger.info("🆔 Voice ID: %s", voice_id)
 
-            # Save to file
             if output_path is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
                 filename = f"output_{timestamp}.mp3"
                 output_path = self.output_dir / filename
 
-            with open(output_path, 'wb') as f:
-                f.write(audio_bytes)
+            cached_path = self._cache_path(text, voice_id, stability, similarity, model)
+            if use_cache and self._restore_from_cache(cached_path, output_path):
+                return str(output_path)
 
-            print(f"✅ Audio generated successfully!")
-            print(f"💾 Saved to: {output_path}")
+            # Write chunks to disk as they arrive instead of buffering the
+            # whole MP3 in memory first. Reads stay small; _write_chunks
+            # coalesces them into _WRITE_BATCH_SIZE vectored writes.
+            try:
+                bytes_written = _write_chunks(
+                    output_path,
+                    self._iter_audio_chunks(text, voice_id, stability, similarity, model)
+                )
+            except Exception:
+                # Don't leave a truncated file behind
+                Path(output_path).unlink(missing_ok=True)
+                raise
+
+            if bytes_written == 0:
+                Path(output_path).unlink(missing_ok=True)
+                logger.error("❌ Speech synthesis failed: no audio received")
+                return None
+
+            if use_cache:
+                self._store_in_cache(output_path, cached_path)
+
+            logger.info("✅ Audio generated successfully!")
+            logger.info("💾 Saved to: %s", output_path)
 
             return str(output_path)
 
         except Exception as e:
-            print(f"❌ Speech synthesis failed: {str(e)}")
+            logger.error("❌ Speech synthesis failed: %s", e)
             return None
     
+    def _cache_path(self, text, voice_id, stability, similarity, model):
+        """
+        Build the cache file path for a synthesis request.
+        """
+        key = hashlib.blake2b(
+            f"{voice_id}|{stability:.3f}|{similarity:.3f}|{model}|{text}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        return self.cache_dir / f"{key}.mp3"
+
+    def _restore_from_cache(self, cached_path, output_path):
+        """
+        Copy a cached entry to output_path.
+        
+        The entry is copied rather than returned directly, since eviction may
+        delete it while callers still hold the path.
+        
+        Returns:
+            bool: True on a cache hit, False if the entry is missing or unreadable
+        """
+        try:
+            os.utime(cached_path)  # mark as recently used
+            shutil.copyfile(cached_path, output_path)
+        except OSError:
+            # Missing, or evicted since the lookup: treat as a miss
+            return False
+
+        logger.info("⚡ Using cached audio: %s", cached_path)
+        return True
+
+    def _store_in_cache(self, audio_path, cached_path):
+        """
+        Copy generated audio into the cache and evict old entries if needed.
+        """
+        try:
+            # Copy to a temp name first so readers never see a partial file
+            tmp_path = cached_path.with_suffix(f".{threading.get_ident()}.part")
+            shutil.copyfile(audio_path, tmp_path)
+            os.replace(tmp_path, cached_path)
+            self._evict_cache()
+        except OSError as e:
+            logger.warning("⚠️ Could not cache audio: %s", e)
+
+    def _evict_cache(self):
+        """
+        Remove least recently used cache entries until under CACHE_MAX_BYTES.
+        """
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(".mp3"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        if total_size <= self.CACHE_MAX_BYTES:
+            return
+
+        for _, size, path in sorted(entries):
+            Path(path).unlink(missing_ok=True)
+            total_size -= size
+            if total_size <= self.CACHE_MAX_BYTES:
+                break
+    
+    def _iter_audio_chunks(self, text, voice_id, stability, similarity, model, chunk_size=4096):
+        """
+        Yield synthesized audio chunks as they arrive
+        
+        Streams through the SDK when enabled, otherwise through the REST API
+        on the keep-alive session. Errors are raised to the caller.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: ID of the voice to use
+            stability: Voice stability (0.0 to 1.0)
+            similarity: Voice similarity boost (0.0 to 1.0)
+            model: TTS model ID
+            chunk_size: REST read size in bytes (default: 4096)
+        
+        Returns:
+            generator: Audio data chunks (bytes)
+        """
+        if self._sdk_stream:
+            started = False
+            try:
+                # SDK expects: stream(voice_id, *, text=..., model_id=..., voice_settings=...)
+                _, VoiceSettings = _lazy_import_elevenlabs()
+                stream_gen = self._sdk_stream(
+                    voice_id,
+                    text=text,
+                    model_id=model,
+                    voice_settings=VoiceSettings(stability=stability, similarity_boost=similarity)
+                )
+                for chunk in stream_gen:
+                    started = True
+                    yield chunk
+                return
+
+            except Exception as e:
+                # fallback to REST streaming, unless part of the audio was
+                # already handed out (restarting would duplicate it)
+                if started:
+                    raise
+                logger.warning("⚠️ SDK streaming failed, using REST API: %s", e)
+
+        url = _TTS_URL.format(voice_id=voice_id)
+        body = _build_payload(text, model, stability, similarity)
+
+        with self._session.post(url, data=body, stream=True, timeout=self.REQUEST_TIMEOUT) as resp:
+            if resp.status_code != 200:
+                raise RuntimeError(f"HTTP {resp.status_code} - {resp.text}")
+            for chunk in resp.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+
     def synthesize_streaming(self, text, voice_id, stability=0.5, similarity=0.75):
         """
         Synthesize speech with streaming (for real-time playback)
@@ -114,52 +571,9 @@ class TextToSpeech:
             generator: Audio data generator
         """
         try:
-            # If SDK streaming supported, use it
-            if hasattr(self.client, 'text_to_speech') and hasattr(self.client.text_to_speech, 'stream'):
-                try:
-                    # SDK expects: stream(voice_id, *, text=..., model_id=..., voice_settings=...)
-                    stream_gen = self.client.text_to_speech.stream(
-                        voice_id,
-                        text=text,
-                        model_id="eleven_monolingual_v1",
-                        voice_settings=VoiceSettings(stability=stability, similarity_boost=similarity)
-                    )
-
-                    # stream_gen is an iterator yielding bytes
-                    for chunk in stream_gen:
-                        yield chunk
-                    return
-
-                except Exception:
-                    # fallback to REST streaming
-                    pass
-
-            # REST streaming fallback
-            url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-            headers = {
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": self.api_key
-            }
-
-            payload = {
-                "text": text,
-                "model": "eleven_monolingual_v1",
-                "voice_settings": {"stability": stability, "similarity_boost": similarity}
-            }
-
-            resp = requests.post(url, headers=headers, json=payload, stream=True)
-            if resp.status_code == 200:
-                for chunk in resp.iter_content(chunk_size=4096):
-                    if chunk:
-                        yield chunk
-            else:
-                print(f"❌ Streaming synthesis failed: HTTP {resp.status_code}")
-                return None
-
+            yield from self._iter_audio_chunks(text, voice_id, stability, similarity, "eleven_monolingual_v1")
         except Exception as e:
-            print(f"❌ Streaming synthesis failed: {str(e)}")
-            return None
+            logger.error("❌ Streaming synthesis failed: %s", e)
     
     def synthesize_multilingual(self, text, voice_id, stability=0.5, similarity=0.75):
         """
@@ -174,111 +588,187 @@ class TextToSpeech:
         Returns:
             str: Path to generated audio file
         """
-        try:
-            print(f"🌍 Multilingual synthesis started...")
-            # Prefer SDK if available
-            if hasattr(self.client, 'generate'):
-                try:
-                    audio_generator = self.client.generate(
-                        text=text,
-                        voice=Voice(
-                            voice_id=voice_id,
-                            settings=VoiceSettings(
-                                stability=stability,
-                                similarity_boost=similarity
-                            )
-                        ),
-                        model="eleven_multilingual_v2"
-                    )
-
-                    audio_bytes = b"".join(audio_generator)
-
-                except Exception:
-                    audio_bytes = self._rest_generate_bytes(text, voice_id, stability, similarity, model="eleven_multilingual_v2")
-            else:
-                audio_bytes = self._rest_generate_bytes(text, voice_id, stability, similarity, model="eleven_multilingual_v2")
-
-            if audio_bytes is None:
-                print("❌ Multilingual synthesis failed: no audio received")
-                return None
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"multilingual_{timestamp}.mp3"
-            output_path = self.output_dir / filename
+        logger.info("🌍 Multilingual synthesis started...")
 
-            with open(output_path, 'wb') as f:
-                f.write(audio_bytes)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filename = f"multilingual_{timestamp}.mp3"
 
-            print(f"✅ Multilingual audio generated!")
-            return str(output_path)
-
-        except Exception as e:
-            print(f"❌ Multilingual synthesis failed: {str(e)}")
-            return None
+        return self.synthesize(
+            text=text,
+            voice_id=voice_id,
+            stability=stability,
+            similarity=similarity,
+            output_path=self.output_dir / filename,
+            model="eleven_multilingual_v2"
+        )
 
     def _rest_generate_bytes(self, text, voice_id, stability, similarity, model="eleven_monolingual_v1"):
         """
-        Fallback to ElevenLabs REST API for generating audio and return raw bytes.
+        Generate audio and return it as raw bytes.
+
+        Returns:
+            bytes: Audio data, or None if failed
         """
         try:
-            url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-            headers = {
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": self.api_key
-            }
-
-            payload = {
-                "text": text,
-                "model": model,
-                "voice_settings": {"stability": stability, "similarity_boost": similarity}
-            }
-
-            resp = requests.post(url, headers=headers, json=payload)
-            if resp.status_code == 200:
-                return resp.content
-            else:
-                print(f"❌ REST TTS failed: HTTP {resp.status_code} - {resp.text}")
-                return None
-
+            # join() sizes the result from the chunk list in one allocation
+            return b"".join(self._iter_audio_chunks(text, voice_id, stability, similarity, model, chunk_size=65536))
         except Exception as e:
-            print(f"❌ REST generate error: {str(e)}")
+            logger.error("❌ REST generate error: %s", e)
             return None
     
-    def batch_synthesize(self, texts, voice_id, stability=0.5, similarity=0.75):
+    def batch_synthesize(self, texts, voice_id, stability=0.5, similarity=0.75, max_workers=None):
         """
-        Synthesize multiple texts
+        Synthesize multiple texts concurrently
         
         Args:
             texts: List of texts to convert
             voice_id: Voice ID to use
             stability: Voice stability
             similarity: Voice similarity boost
+            max_workers: Number of parallel requests (default: MAX_CONCURRENT_REQUESTS)
         
         Returns:
-            list: List of generated audio file paths
+            list: List of generated audio file paths, in input order
+        """
+        if not texts:
+            return []
+
+        if max_workers is None:
+            max_workers = self.MAX_CONCURRENT_REQUESTS
+        max_workers = max(1, min(max_workers, len(texts)))
+
+        results = {}
+
+        # One timestamp per batch; the index keeps filenames unique
+        base_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for i, text in enumerate(texts):
+                filename = f"batch_{i+1:04d}_{base_timestamp}.mp3"
+                output_path = self.output_dir / filename
+
+                future = executor.submit(
+                    self._batch_item,
+                    i, len(texts),
+                    text=text,
+                    voice_id=voice_id,
+                    stability=stability,
+                    similarity=similarity,
+                    output_path=output_path
+                )
+                futures[future] = i
+
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return [results[i] for i in range(len(texts)) if results[i]]
+
+    def _batch_item(self, index, total, **kwargs):
         """
-        output_paths = []
+        Synthesize one batch entry while holding a rate-limit slot.
+        """
+        with self._request_slots:
+            logger.info("📄 Synthesizing %d/%d...", index + 1, total)
+            return self.synthesize(**kwargs)
+
+    async def batch_synthesize_async(self, texts, voice_id, stability=0.5, similarity=0.75, max_concurrency=None):
+        """
+        Synthesize multiple texts concurrently on a single event loop
         
-        for i, text in enumerate(texts):
-            print(f"\n📄 Synthesizing {i+1}/{len(texts)}...")
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"batch_{i+1}_{timestamp}.mp3"
-            output_path = self.output_dir / filename
-            
-            result = self.synthesize(
-                text=text,
-                voice_id=voice_id,
-                stability=stability,
-                similarity=similarity,
-                output_path=output_path
-            )
-            
-            if result:
-                output_paths.append(result)
+        Uses aiohttp against the REST API, so large batches can keep many
+        requests in flight without a thread per request.
+        
+        Args:
+            texts: List of texts to convert
+            voice_id: Voice ID to use
+            stability: Voice stability
+            similarity: Voice similarity boost
+            max_concurrency: Requests in flight at once (default: MAX_CONCURRENT_REQUESTS)
         
-        return output_paths
+        Returns:
+            list: List of generated audio file paths, in input order
+        """
+        import aiohttp
+
+        if not texts:
+            return []
+
+        if max_concurrency is None:
+            max_concurrency = self.MAX_CONCURRENT_REQUESTS
+        max_concurrency = max(1, max_concurrency)
+
+        url = _TTS_URL.format(voice_id=voice_id)
+        model = "eleven_monolingual_v1"
+        base_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def post_with_retry(session, body):
+            # Mirrors the sync session's Retry policy: 429/5xx and failed
+            # connects are retried with exponential backoff (or Retry-After).
+            # Timeouts and read errors are not, since the server may still be
+            # generating (and billing) the request.
+            for attempt in range(_MAX_RETRIES + 1):
+                retry_after = None
+                try:
+                    async with session.post(url, data=body) as resp:
+                        if resp.status == 200:
+                            return await resp.read()
+                        if resp.status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                            logger.error("❌ REST TTS failed: HTTP %s - %s", resp.status, await resp.text())
+                            return None
+                        retry_after = resp.headers.get("Retry-After")
+                except aiohttp.ClientConnectorError as e:
+                    if attempt == _MAX_RETRIES:
+                        logger.error("❌ Speech synthesis failed: %s", e)
+                        return None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error("❌ Speech synthesis failed: %s", e)
+                    return None
+
+                if retry_after and retry_after.isdigit():
+                    delay = int(retry_after)
+                else:
+                    delay = _RETRY_BACKOFF * (2 ** attempt)
+                await asyncio.sleep(delay)
+
+        def save_audio(output_path, cached_path, audio_bytes):
+            Path(output_path).write_bytes(audio_bytes)
+            self._store_in_cache(output_path, cached_path)
+
+        async def synthesize_one(session, index, text):
+            output_path = self.output_dir / f"batch_{index+1:04d}_{base_timestamp}.mp3"
+            cached_path = self._cache_path(text, voice_id, stability, similarity, model)
+            if await asyncio.to_thread(self._restore_from_cache, cached_path, output_path):
+                return str(output_path)
+
+            async with semaphore:
+                logger.info("📄 Synthesizing %d/%d...", index + 1, len(texts))
+                body = _build_payload(text, model, stability, similarity)
+                audio_bytes = await post_with_retry(session, body)
+
+            if not audio_bytes:
+                if audio_bytes is not None:
+                    logger.error("❌ Speech synthesis failed: no audio received")
+                return None
+
+            # File I/O runs off the event loop; a failure only drops this item
+            try:
+                await asyncio.to_thread(save_audio, output_path, cached_path, audio_bytes)
+            except OSError as e:
+                logger.error("❌ Could not save audio: %s", e)
+                return None
+
+            return str(output_path)
+
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(headers=self._headers, connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(synthesize_one(session, i, text) for i, text in enumerate(texts))
+            )
+
+        return [path for path in results if path]
     
     def get_available_models(self):
         """
@@ -305,16 +795,7 @@ class TextToSpeech:
         Returns:
             tuple: (is_valid, message)
         """
-        if not text or text.strip() == "":
-            return False, "Text is empty"
-        
-        if len(text) > max_length:
-            return False, f"Text too long ({len(text)} chars). Maximum: {max_length}"
-        
-        # Check for special characters that might cause issues
-        # This is optional and depends on your requirements
-        
-        return True, "Text valid"
+        return _validate_text(text, max_length)
     
     def estimate_audio_duration(self, text, words_per_minute=150):
         """
@@ -327,7 +808,8 @@ class TextToSpeech:
         Returns:
             float: Estimated duration in seconds
         """
-        word_count = len(text.split())
+        # Count matches lazily instead of materializing text.split()
+        word_count = sum(1 for _ in _WORD_PATTERN.finditer(text))
         duration_minutes = word_count / words_per_minute
         duration_seconds = duration_minutes * 60
         
@@ -341,15 +823,9 @@ class TextToSpeech:
             preset: Preset name ('stable', 'balanced', 'expressive')
         
         Returns:
-            dict: Voice settings
+            VoicePreset: Voice settings (stability, similarity)
         """
-        presets = {
-            'stable': {'stability': 0.75, 'similarity': 0.75},
-            'balanced': {'stability': 0.50, 'similarity': 0.75},
-            'expressive': {'stability': 0.30, 'similarity': 0.80}
-        }
-        
-        return presets.get(preset, presets['balanced'])
+        return _VOICE_PRESETS.get(preset, _VOICE_PRESETS['balanced'])
     
     def synthesize_with_preset(self, text, voice_id, preset='balanced'):
         """
@@ -368,8 +844,8 @@ class TextToSpeech:
         return self.synthesize(
             text=text,
             voice_id=voice_id,
-            stability=settings['stability'],
-            similarity=settings['similarity']
+            stability=settings.stability,
+            similarity=settings.similarity
         )
     
     def get_audio_info(self, audio_path):
@@ -383,6 +859,13 @@ class TextToSpeech:
             dict: Audio information
         """
         try:
+            # MP3 headers are parsed directly; libsndfile is only needed for
+            # other formats
+            if Path(audio_path).suffix.lower() == '.mp3':
+                info = _read_mp3_info(audio_path)
+                if info is not None:
+                    return info
+
             import soundfile as sf
             
             info = sf.info(audio_path)
@@ -397,5 +880,5 @@ class TextToSpeech:
             }
             
         except Exception as e:
-            print(f"❌ Error getting audio info: {str(e)}")
+            logger.error("❌ Error getting audio info: %s", e)
             return None
@@ -4,8 +4,12 @@ Audio Module Tests
 
 import unittest
 import sys
+import tempfile
 from pathlib import Path
 
+import numpy as np
+import soundfile as sf
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -45,6 +49,18 @@ class TestAudioUtils(unittest.TestCase):
         
         valid, msg = Validators.validate_channels(3)
         self.assertFalse(valid)
+    
+    def test_split_audio(self):
+        """Test splitting audio into fixed-length chunks"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = str(Path(tmp_dir) / "input.wav")
+            sf.write(input_path, np.zeros(22050 * 12), 22050)
+            
+            chunks = AudioUtils.split_audio(input_path, Path(tmp_dir) / "chunks", chunk_duration=5)
+            
+            self.assertEqual(len(chunks), 3)
+            durations = [sf.info(chunk).duration for chunk in chunks]
+            self.assertEqual(durations, [5.0, 5.0, 2.0])
 
 
 class TestValidators(unittest.TestCase):
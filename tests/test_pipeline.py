@@ -0,0 +1,129 @@
+"""
+Speech-to-Speech Pipeline Tests
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import soundfile as sf
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.pipeline import ChunkTranslator, run_speech_translation, PIPELINE_CHUNK_SECONDS
+
+
+class TestRunSpeechTranslation(unittest.TestCase):
+    """Test the chunked, overlapping stage pipeline"""
+
+    def setUp(self):
+        """Write a recording whose chunks are tagged by their sample value"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.chunk_dir = Path(tmp.name) / "chunks"
+        self.chunk_dir.mkdir()
+
+        sample_rate = 8000
+        chunk_samples = sample_rate * PIPELINE_CHUNK_SECONDS
+        # Four chunks; chunk i is filled with the value i / 10
+        audio = np.concatenate([np.full(chunk_samples, i / 10, dtype=np.float32) for i in range(4)])
+        self.audio_path = str(Path(tmp.name) / "recording.wav")
+        sf.write(self.audio_path, audio, sample_rate, subtype='FLOAT')
+
+    @staticmethod
+    def transcribe(path):
+        """Fake transcriber that names the chunk it was given"""
+        data, _ = sf.read(path, frames=1)
+        return f"chunk{round(data[0] * 10)}"
+
+    def test_results_in_chunk_order(self):
+        """Test every stage's results line up with the input chunks"""
+        updates = []
+        results, failures = run_speech_translation(
+            self.audio_path, self.chunk_dir,
+            (self.transcribe, str.upper, lambda text: text + ".mp3"),
+            on_update=lambda stage, chunk, _: updates.append((stage, chunk))
+        )
+
+        self.assertEqual(results, [
+            ["chunk0", "chunk1", "chunk2", "chunk3"],
+            ["CHUNK0", "CHUNK1", "CHUNK2", "CHUNK3"],
+            ["CHUNK0.mp3", "CHUNK1.mp3", "CHUNK2.mp3", "CHUNK3.mp3"]
+        ])
+        self.assertEqual(failures, [])
+        self.assertEqual(sorted(updates), [(s, c) for s in range(3) for c in range(4)])
+        # Temporary chunk files are removed
+        self.assertEqual(list(self.chunk_dir.iterdir()), [])
+
+    def test_failures_are_reported(self):
+        """Test a stage that raises or returns None is recorded per chunk"""
+        def translate(text):
+            if text == "chunk2":
+                raise RuntimeError("translation service down")
+            return text.upper()
+
+        def synthesize(text):
+            return None if text == "CHUNK0" else text + ".mp3"
+
+        results, failures = run_speech_translation(
+            self.audio_path, self.chunk_dir, (self.transcribe, translate, synthesize)
+        )
+
+        self.assertEqual(failures, [(2, 0), (1, 2)])
+        self.assertEqual(results[2], [None, "CHUNK1.mp3", None, "CHUNK3.mp3"])
+
+    def test_empty_chunks_are_skipped(self):
+        """Test an empty transcript skips later stages without counting as a failure"""
+        translate = mock.Mock(side_effect=str.upper)
+
+        def transcribe(path):
+            text = self.transcribe(path)
+            return "" if text == "chunk1" else text
+
+        results, failures = run_speech_translation(
+            self.audio_path, self.chunk_dir, (transcribe, translate)
+        )
+
+        self.assertEqual(failures, [])
+        self.assertEqual(results[1], ["CHUNK0", None, "CHUNK2", "CHUNK3"])
+        self.assertEqual(translate.call_count, 3)
+
+
+class TestChunkTranslator(unittest.TestCase):
+    """Test source language pinning in the translate stage"""
+
+    def setUp(self):
+        """Set up a fake translator"""
+        self.translator = mock.Mock()
+        self.translator.detect_language.return_value = "tr"
+        self.translator.translate.side_effect = lambda text, target, source_lang: f"{source_lang}:{text}"
+
+    def test_auto_until_enough_text(self):
+        """Test chunks are auto-detected until min_chars of transcript accumulate"""
+        translate = ChunkTranslator(self.translator, "en", min_chars=20)
+
+        self.assertEqual(translate("merhaba"), "auto:merhaba")
+        self.translator.detect_language.assert_not_called()
+
+        self.assertEqual(translate("nasılsınız bugün"), "tr:nasılsınız bugün")
+        self.translator.detect_language.assert_called_once_with("merhaba nasılsınız bugün")
+
+        self.assertEqual(translate("iyiyim"), "tr:iyiyim")
+        self.assertEqual(self.translator.detect_language.call_count, 1)
+
+    def test_failed_detection_is_retried(self):
+        """Test a failed detection keeps using 'auto' and tries again later"""
+        self.translator.detect_language.side_effect = [None, "tr"]
+        translate = ChunkTranslator(self.translator, "en", min_chars=5)
+
+        self.assertEqual(translate("merhaba"), "auto:merhaba")
+        self.assertEqual(translate("dünya"), "tr:dünya")
+        self.translator.detect_language.assert_called_with("merhaba dünya")
+
+
+if __name__ == '__main__':
+    unittest.main()
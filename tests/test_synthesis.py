@@ -0,0 +1,489 @@
+"""
+Speech Synthesis Tests
+"""
+
+import unittest
+import sys
+import tempfile
+import json
+import os
+import asyncio
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.text_to_speech as text_to_speech
+from core.text_to_speech import TextToSpeech, _build_payload, _write_buffers, _write_chunks
+
+# Backoff sleeps are patched out; test servers use the real one
+_real_sleep = asyncio.sleep
+
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests.Response"""
+
+    def __init__(self, status_code=200, chunks=(), text=""):
+        self.status_code = status_code
+        self.chunks = list(chunks)
+        self.text = text
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size=None):
+        self.chunk_size = chunk_size
+        return iter(self.chunks)
+
+
+def fake_session(handler):
+    """Build a session mock whose post() answers with handler(text)"""
+    session = mock.Mock()
+    session.post.side_effect = lambda url, data, **kwargs: handler(json.loads(data)["text"])
+    return session
+
+
+class TestTextToSpeech(unittest.TestCase):
+    """Test text-to-speech helper functionality"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.tts = TextToSpeech("test_api_key", warmup=False)
+
+    def test_validate_text(self):
+        """Test text validation"""
+        valid, msg = self.tts.validate_text("Hello")
+        self.assertTrue(valid)
+
+        for empty_text in ["", "   ", "\n\t "]:
+            valid, msg = self.tts.validate_text(empty_text)
+            self.assertFalse(valid, f"Text {empty_text!r} should be invalid")
+
+        valid, msg = self.tts.validate_text("a" * 101, max_length=100)
+        self.assertFalse(valid)
+
+    def test_estimate_audio_duration(self):
+        """Test duration estimation from word count"""
+        duration = self.tts.estimate_audio_duration("one two  three\nfour\tfive", words_per_minute=60)
+        self.assertAlmostEqual(duration, 5.0)
+
+        duration = self.tts.estimate_audio_duration("   ")
+        self.assertEqual(duration, 0)
+
+    def test_get_voice_settings_preset(self):
+        """Test voice settings presets"""
+        preset = self.tts.get_voice_settings_preset('stable')
+        self.assertEqual(preset.stability, 0.75)
+        self.assertEqual(preset.similarity, 0.75)
+
+        # Unknown presets fall back to 'balanced'
+        self.assertEqual(
+            self.tts.get_voice_settings_preset('unknown'),
+            self.tts.get_voice_settings_preset('balanced')
+        )
+
+    def test_build_payload(self):
+        """Test prebuilt request body matches regular JSON encoding"""
+        text = 'Merhaba "dünya"\nHello'
+        body = _build_payload(text, "eleven_multilingual_v2", 0.3, 0.8)
+
+        self.assertEqual(json.loads(body), {
+            "text": text,
+            "model_id": "eleven_multilingual_v2",
+            "voice_settings": {"stability": 0.3, "similarity_boost": 0.8}
+        })
+
+    def test_session_retry_policy(self):
+        """Test POSTs are retried on connect errors and 429/5xx, never after a read"""
+        retry = self.tts._session.get_adapter("https://api.elevenlabs.io").max_retries
+        self.assertEqual(retry.read, 0)
+        self.assertIn(429, retry.status_forcelist)
+        self.assertGreater(retry.connect or retry.total, 0)
+
+    def _write_mp3(self, frames):
+        """Write an MP3 file with an ID3v2 tag followed by the given frames"""
+        tmp = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
+        self.addCleanup(Path(tmp.name).unlink)
+        with tmp:
+            # ID3v2 tag with a 20-byte (synchsafe) body
+            tmp.write(b"ID3\x03\x00\x00\x00\x00\x00\x14" + b"\x00" * 20)
+            tmp.write(frames)
+        return tmp.name
+
+    def test_get_audio_info_mp3_cbr(self):
+        """Test MP3 header parsing for constant bitrate files"""
+        # MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames
+        frame = b"\xff\xfb\x90\x00" + b"\x00" * 413
+        path = self._write_mp3(frame * 100)
+
+        info = self.tts.get_audio_info(path)
+        self.assertEqual(info['sample_rate'], 44100)
+        self.assertEqual(info['channels'], 2)
+        self.assertEqual(info['format'], 'MP3')
+        self.assertAlmostEqual(info['duration'], 100 * 417 * 8 / 128000)
+
+    def test_get_audio_info_mp3_id3v1_trailer(self):
+        """Test a trailing ID3v1 tag is not counted as audio"""
+        frame = b"\xff\xfb\x90\x00" + b"\x00" * 413
+        path = self._write_mp3(frame * 100 + b"TAG" + b"\x00" * 125)
+
+        info = self.tts.get_audio_info(path)
+        self.assertAlmostEqual(info['duration'], 100 * 417 * 8 / 128000)
+
+    def test_get_audio_info_mp3_xing(self):
+        """Test MP3 header parsing with a Xing frame count"""
+        # MPEG-1 Layer III, 128 kbps, 48 kHz, mono
+        header = b"\xff\xfb\x94\xc0"
+        xing = b"Xing" + (1).to_bytes(4, 'big') + (250).to_bytes(4, 'big')
+        frame = header + b"\x00" * 17 + xing
+        path = self._write_mp3(frame + b"\x00" * 400)
+
+        info = self.tts.get_audio_info(path)
+        self.assertEqual(info['sample_rate'], 48000)
+        self.assertEqual(info['channels'], 1)
+        self.assertEqual(info['frames'], 250 * 1152)
+        self.assertAlmostEqual(info['duration'], 250 * 1152 / 48000)
+
+    def test_get_audio_info_mp3_xing_with_crc(self):
+        """Test the Xing tag is found after a CRC-protected header"""
+        # Protection bit cleared (0xfa): a 2-byte CRC follows the header
+        header = b"\xff\xfa\x94\xc0" + b"\x12\x34"
+        xing = b"Info" + (1).to_bytes(4, 'big') + (300).to_bytes(4, 'big')
+        frame = header + b"\x00" * 17 + xing
+        path = self._write_mp3(frame + b"\x00" * 400)
+
+        info = self.tts.get_audio_info(path)
+        self.assertEqual(info['frames'], 300 * 1152)
+        self.assertAlmostEqual(info['duration'], 300 * 1152 / 48000)
+
+
+class SynthesisTestCase(unittest.TestCase):
+    """Base case with output and cache directories in a temp dir"""
+
+    def setUp(self):
+        """Point the output and cache directories at a temp dir"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tts = TextToSpeech("test_api_key", warmup=False)
+        self.tts.output_dir = Path(tmp.name) / "outputs"
+        self.tts.cache_dir = Path(tmp.name) / "cache"
+        self.tts.output_dir.mkdir()
+        self.tts.cache_dir.mkdir()
+
+
+class TestSynthesisCache(SynthesisTestCase):
+    """Test the on-disk synthesis cache"""
+
+    def setUp(self):
+        """Answer every request with the text followed by '-audio'"""
+        super().setUp()
+        self.tts._session = fake_session(lambda text: FakeResponse(chunks=[text.encode(), b"-audio"]))
+
+    def test_cache_miss_then_hit(self):
+        """Test a repeated request is served from the cache"""
+        first = self.tts.synthesize("Hello", "voice")
+        second = self.tts.synthesize("Hello", "voice")
+
+        self.assertEqual(self.tts._session.post.call_count, 1)
+        self.assertNotEqual(first, second)
+        self.assertEqual(Path(second).read_bytes(), b"Hello-audio")
+        # Hits are copied into output_dir, never handed out from the cache
+        self.assertEqual(Path(second).parent, self.tts.output_dir)
+
+        # Different settings are a different cache entry
+        self.tts.synthesize("Hello", "voice", stability=0.9)
+        self.assertEqual(self.tts._session.post.call_count, 2)
+
+    def test_cache_disabled(self):
+        """Test use_cache=False always calls the API"""
+        self.tts.synthesize("Hello", "voice", use_cache=False)
+        self.tts.synthesize("Hello", "voice", use_cache=False)
+
+        self.assertEqual(self.tts._session.post.call_count, 2)
+        self.assertEqual(list(self.tts.cache_dir.iterdir()), [])
+
+    def test_cache_entry_evicted_after_lookup(self):
+        """Test an entry vanishing before it is copied counts as a miss"""
+        self.tts.synthesize("Hello", "voice")
+        for entry in self.tts.cache_dir.iterdir():
+            entry.unlink()
+
+        path = self.tts.synthesize("Hello", "voice")
+        self.assertEqual(self.tts._session.post.call_count, 2)
+        self.assertEqual(Path(path).read_bytes(), b"Hello-audio")
+
+    def test_cache_eviction(self):
+        """Test least recently used entries are evicted first"""
+        self.tts.CACHE_MAX_BYTES = 25  # room for two 11-byte entries
+        for i, text in enumerate(["Aaaaa", "Bbbbb"]):
+            self.tts.synthesize(text, "voice")
+            cached = self.tts._cache_path(text, "voice", 0.5, 0.75, "eleven_monolingual_v1")
+            os.utime(cached, (1000 + i, 1000 + i))
+
+        # Touch the older entry, then push the cache over its limit
+        self.tts.synthesize("Aaaaa", "voice")
+        self.tts.synthesize("Ccccc", "voice")
+
+        cached = {
+            text: self.tts._cache_path(text, "voice", 0.5, 0.75, "eleven_monolingual_v1").exists()
+            for text in ["Aaaaa", "Bbbbb", "Ccccc"]
+        }
+        self.assertEqual(cached, {"Aaaaa": True, "Bbbbb": False, "Ccccc": True})
+
+    def test_failed_request_leaves_no_files(self):
+        """Test an API error returns None and leaves nothing behind"""
+        self.tts._session = fake_session(lambda text: FakeResponse(status_code=500, text="boom"))
+
+        self.assertIsNone(self.tts.synthesize("Hello", "voice"))
+        self.assertEqual(list(self.tts.output_dir.iterdir()), [])
+        self.assertEqual(list(self.tts.cache_dir.iterdir()), [])
+
+
+class TestSynthesize(SynthesisTestCase):
+    """Test streaming synthesis to disk"""
+
+    def test_small_reads_are_coalesced(self):
+        """Test streamed reads are combined into batched writes"""
+        response = FakeResponse(chunks=[b"x" * 4096] * 64)
+        self.tts._session = fake_session(lambda text: response)
+
+        with mock.patch.object(text_to_speech, "_write_buffers", wraps=_write_buffers) as write:
+            path = self.tts.synthesize("Hello", "voice", use_cache=False)
+
+        self.assertLess(response.chunk_size, text_to_speech._WRITE_BATCH_SIZE)
+        self.assertEqual(Path(path).stat().st_size, 64 * 4096)
+        self.assertEqual(write.call_count, 64 * 4096 // text_to_speech._WRITE_BATCH_SIZE)
+
+
+class TestBatchSynthesize(SynthesisTestCase):
+    """Test concurrent batch synthesis"""
+
+    def test_results_keep_input_order(self):
+        """Test results follow input order and failed items are dropped"""
+        def handler(text):
+            if text.startswith("fail"):
+                return FakeResponse(status_code=503, text="unavailable")
+            return FakeResponse(chunks=[text.encode()])
+
+        self.tts._session = fake_session(handler)
+        texts = ["one", "fail-a", "three", "four", "fail-b", "six"]
+        paths = self.tts.batch_synthesize(texts, "voice", max_workers=3)
+
+        self.assertEqual([Path(p).read_bytes() for p in paths], [b"one", b"three", b"four", b"six"])
+        self.assertEqual(
+            [Path(p).name.split("_")[1] for p in paths],
+            ["0001", "0003", "0004", "0006"]
+        )
+
+    def test_back_to_back_batches_dont_collide(self):
+        """Test a second batch never overwrites the first batch's files"""
+        self.tts._session = fake_session(lambda text: FakeResponse(chunks=[text.encode()]))
+        first = self.tts.batch_synthesize(["a1", "a2"], "voice", max_workers=1)
+        second = self.tts.batch_synthesize(["b1", "b2"], "voice", max_workers=1)
+
+        self.assertFalse(set(first) & set(second))
+        self.assertEqual([Path(p).read_bytes() for p in first], [b"a1", b"a2"])
+
+    def test_request_timeout(self):
+        """Test every request is sent with a timeout"""
+        self.tts._session = fake_session(lambda text: FakeResponse(chunks=[b"x"]))
+        self.tts.batch_synthesize(["one", "two"], "voice")
+
+        for call in self.tts._session.post.call_args_list:
+            self.assertEqual(call.kwargs["timeout"], self.tts.REQUEST_TIMEOUT)
+
+    def test_empty_batch(self):
+        """Test an empty batch makes no requests"""
+        self.tts._session = fake_session(lambda text: FakeResponse(chunks=[b"x"]))
+        self.assertEqual(self.tts.batch_synthesize([], "voice"), [])
+        self.tts._session.post.assert_not_called()
+
+
+class TestBatchSynthesizeAsync(SynthesisTestCase):
+    """Test async batch synthesis against a local HTTP server"""
+
+    def setUp(self):
+        """Record requests per text and backoff delays"""
+        super().setUp()
+        self.hits = {}
+        self.delays = []
+
+    def _run_batch(self, handler, texts, url=None, **kwargs):
+        """Serve handler(text, attempt) locally and run batch_synthesize_async against it"""
+        from aiohttp import web
+
+        async def respond(request):
+            text = json.loads(await request.read())["text"]
+            self.hits[text] = self.hits.get(text, 0) + 1
+            return await handler(text, self.hits[text])
+
+        async def fake_sleep(delay, *args, **kw):
+            self.delays.append(delay)
+            await _real_sleep(0)
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/{voice_id}", respond)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            host, port = runner.addresses[0][:2]
+            try:
+                with mock.patch.object(text_to_speech, "_TTS_URL", url or f"http://{host}:{port}/{{voice_id}}"), \
+                        mock.patch.object(text_to_speech.asyncio, "sleep", fake_sleep):
+                    return await self.tts.batch_synthesize_async(texts, "voice", **kwargs)
+            finally:
+                await runner.cleanup()
+
+        return asyncio.run(run())
+
+    def test_results_keep_input_order(self):
+        """Test results follow input order and a failed item is isolated"""
+        from aiohttp import web
+
+        async def handler(text, attempt):
+            # Finish in reverse order to shuffle completion
+            await _real_sleep(0.01 * (5 - int(text[-1])))
+            if text == "item-2":
+                return web.Response(status=400, text="bad request")
+            return web.Response(body=text.encode())
+
+        texts = [f"item-{i}" for i in range(5)]
+        paths = self._run_batch(handler, texts)
+
+        self.assertEqual(
+            [Path(p).read_bytes() for p in paths],
+            [b"item-0", b"item-1", b"item-3", b"item-4"]
+        )
+        # Client errors are not retried
+        self.assertEqual(self.hits["item-2"], 1)
+
+    def test_retries_server_errors(self):
+        """Test 429/5xx responses are retried with backoff or Retry-After"""
+        from aiohttp import web
+
+        async def handler(text, attempt):
+            if attempt == 1:
+                return web.Response(status=429, headers={"Retry-After": "7"})
+            if attempt == 2:
+                return web.Response(status=503)
+            return web.Response(body=b"audio")
+
+        paths = self._run_batch(handler, ["Hello"])
+
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(self.hits["Hello"], 3)
+        self.assertEqual(self.delays, [7, text_to_speech._RETRY_BACKOFF * 2])
+
+    def test_gives_up_after_max_retries(self):
+        """Test a persistently failing item is dropped after _MAX_RETRIES"""
+        from aiohttp import web
+
+        async def handler(text, attempt):
+            return web.Response(status=500 if text == "bad" else 200, body=text.encode())
+
+        paths = self._run_batch(handler, ["good", "bad"])
+
+        self.assertEqual([Path(p).read_bytes() for p in paths], [b"good"])
+        self.assertEqual(self.hits["bad"], text_to_speech._MAX_RETRIES + 1)
+
+    def test_timeout_is_not_retried(self):
+        """Test a stalled request is sent once, never re-posted"""
+        from aiohttp import web
+
+        async def handler(text, attempt):
+            await _real_sleep(1)
+            return web.Response(body=b"late")
+
+        self.tts.REQUEST_TIMEOUT = 0.2
+        self.assertEqual(self._run_batch(handler, ["Hello"]), [])
+        self.assertEqual(self.hits["Hello"], 1)
+
+    def test_connect_errors_are_retried(self):
+        """Test failed connects are retried before the item is dropped"""
+        async def handler(text, attempt):
+            raise AssertionError("unreachable")
+
+        # Nothing listens on port 9 (discard) locally
+        paths = self._run_batch(handler, ["Hello"], url="http://127.0.0.1:9/{voice_id}")
+
+        self.assertEqual(paths, [])
+        self.assertEqual(len(self.delays), text_to_speech._MAX_RETRIES)
+
+    def test_cache_hit_skips_request(self):
+        """Test a cached item is restored without a request"""
+        from aiohttp import web
+
+        async def handler(text, attempt):
+            return web.Response(body=b"audio")
+
+        self._run_batch(handler, ["Hello"])
+        paths = self._run_batch(handler, ["Hello"])
+
+        self.assertEqual(self.hits["Hello"], 1)
+        self.assertEqual(Path(paths[0]).read_bytes(), b"audio")
+
+
+class TestWriteChunks(unittest.TestCase):
+    """Test batched file writes"""
+
+    def setUp(self):
+        """Create a temp output file"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "out.mp3"
+
+    def test_write_chunks(self):
+        """Test chunks are written in order and empty chunks skipped"""
+        chunks = [b"abc", b"", bytearray(b"def"), memoryview(b"ghi")] + [b"x" * 1000] * 300
+        written = _write_chunks(self.path, iter(chunks))
+
+        expected = b"".join(chunks)
+        self.assertEqual(written, len(expected))
+        self.assertEqual(self.path.read_bytes(), expected)
+
+    def test_write_chunks_empty(self):
+        """Test an empty stream yields an empty file"""
+        self.assertEqual(_write_chunks(self.path, iter([b"", b""])), 0)
+        self.assertEqual(self.path.read_bytes(), b"")
+
+    @unittest.skipUnless(hasattr(os, 'writev'), "requires os.writev")
+    def test_write_buffers_short_write(self):
+        """Test a partial writev is completed with plain writes"""
+        buffers = [b"first", b"second", b"third"]
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT)
+        try:
+            # Only the first buffer makes it out, then write() is also short
+            real_write = os.write
+            short_writev = lambda fd, bufs: real_write(fd, bufs[0])
+            short_write = lambda fd, data: real_write(fd, bytes(data[:4]))
+            with mock.patch("os.writev", side_effect=short_writev), \
+                    mock.patch("os.write", side_effect=short_write) as write:
+                _write_buffers(fd, buffers)
+        finally:
+            os.close(fd)
+
+        self.assertEqual(self.path.read_bytes(), b"firstsecondthird")
+        self.assertGreater(write.call_count, 1)
+
+    def test_write_buffers_without_writev(self):
+        """Test the fallback used where os.writev is unavailable"""
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT)
+        try:
+            with mock.patch.object(os, "writev", create=True) as writev:
+                del os.writev
+                _write_buffers(fd, [b"no", b"-", b"writev"])
+        finally:
+            os.close(fd)
+
+        writev.assert_not_called()
+        self.assertEqual(self.path.read_bytes(), b"no-writev")
+
+
+if __name__ == '__main__':
+    unittest.main()
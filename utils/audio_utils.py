@@ -7,6 +7,7 @@ import soundfile as sf
 import numpy as np
 from pathlib import Path
 import os
+import shutil
 
 
 class AudioUtils:
@@ -264,6 +265,70 @@ class AudioUtils:
             print(f"❌ Merging failed: {str(e)}")
             return False
     
+    @staticmethod
+    def concatenate_mp3_files(audio_files, output_path):
+        """
+        Concatenate MP3 files into one without re-encoding
+        (MP3 streams are sequences of independent frames, so bytes can be joined)
+        
+        Args:
+            audio_files: List of MP3 file paths
+            output_path: Path for output MP3 file
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            if not audio_files:
+                print("⚠️ No audio files provided")
+                return False
+            
+            with open(output_path, 'wb') as out_file:
+                for audio_file in audio_files:
+                    with open(audio_file, 'rb') as in_file:
+                        shutil.copyfileobj(in_file, out_file)
+            
+            print(f"✅ {len(audio_files)} MP3 files concatenated")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Concatenation failed: {str(e)}")
+            return False
+    
+    @staticmethod
+    def split_audio(input_path, output_dir, chunk_duration=5):
+        """
+        Split audio file into fixed-length chunks
+        
+        Args:
+            input_path: Path to input audio
+            output_dir: Directory for chunk files
+            chunk_duration: Chunk length in seconds (default: 5)
+        
+        Returns:
+            list: Chunk file paths in playback order, or empty list if failed
+        """
+        try:
+            samplerate = sf.info(input_path).samplerate
+            chunk_frames = int(chunk_duration * samplerate)
+            
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            stem = Path(input_path).stem
+            
+            chunk_paths = []
+            for i, block in enumerate(sf.blocks(input_path, blocksize=chunk_frames)):
+                chunk_path = output_dir / f"{stem}_chunk{i:03d}.wav"
+                sf.write(str(chunk_path), block, samplerate)
+                chunk_paths.append(str(chunk_path))
+            
+            print(f"✅ Audio split into {len(chunk_paths)} chunks")
+            return chunk_paths
+            
+        except Exception as e:
+            print(f"❌ Splitting failed: {str(e)}")
+            return []
+    
     @staticmethod
     def extract_audio_segment(input_path, output_path, start_ms, end_ms):
         """